@@ -1,12 +1,19 @@
+import asyncio
+import errno
+import logging
 import os
 import shutil
-from datetime import datetime, date
+from datetime import date, datetime, time, timedelta
 from typing import List
 
+log = logging.getLogger(__name__)
+
+RECORDING_SUFFIXES = (".mp4", ".MP4")
+
 
 def collapse_sub_folders(path: str) -> None:
     """
-    Recursively collapses subfolders and moves all items to the parent folder.
+    Collapses all nested subfolders and moves their items to the top-level folder.
 
     Parameters:
         path (str): The path of the folder to collapse.
@@ -19,6 +26,11 @@ def collapse_sub_folders(path: str) -> None:
 
     Note:
         - This function collapses subfolders within the specified path and moves all items to the parent folder.
+        - The folder tree is read up front by `_walk_sub_folders`, which scans sibling folders concurrently in
+          worker threads and reads each folder only once. Every folder is scanned in its own asyncio task, so deep
+          trees cannot hit the recursion limit.
+        - Items are moved straight to the top-level folder with `os.replace`, so every file is moved exactly once.
+          `shutil.move` is only used when a subfolder is on a different file system.
         - Empty subfolders are removed after moving their contents to the parent folder.
         - The function performs potentially destructive operations, so use with caution and ensure you have a backup of your data.
 
@@ -28,23 +40,64 @@ def collapse_sub_folders(path: str) -> None:
         collapse_sub_folders(folder_path)
     """
     try:
-        for item in os.listdir(path):
-            item_path = os.path.join(path, item)
+        sub_folders, sub_items = asyncio.run(_walk_sub_folders(path))
 
-            if os.path.isdir(item_path):
-                collapse_sub_folders(item_path)
+        for sub_item in sub_items:
+            _move(sub_item.path, os.path.join(path, sub_item.name))
 
-                for sub_item in os.listdir(item_path):
-                    sub_item_path = os.path.join(item_path, sub_item)
-                    new_item_path = os.path.join(path, sub_item)
-                    shutil.move(sub_item_path, new_item_path)
-
-                os.rmdir(item_path)
+        # Sub-folders are discovered parent-first, so reversing removes the deepest ones first.
+        for item_path in reversed(sub_folders):
+            os.rmdir(item_path)
     except OSError as e:
-        print(f"An error occurred while collapsing subfolders: {e}")
+        log.error(f"An error occurred while collapsing subfolders: {e}")
         raise
 
 
+async def _walk_sub_folders(
+    path: str, include_items: bool = False
+) -> tuple[list[str], list[os.DirEntry]]:
+    """
+    Scans the folder tree under `path`, reading sibling sub-folders concurrently in worker threads.
+
+    Returns every sub-folder path, each listed before its own sub-folders, and every non-folder entry found in
+    them. Entries directly inside `path` are only included when `include_items` is True.
+    """
+    sub_folders, sub_items = await asyncio.to_thread(_scan_folder, path)
+    if not include_items:
+        sub_items = []
+
+    results = await asyncio.gather(
+        *(_walk_sub_folders(folder, include_items=True) for folder in sub_folders)
+    )
+    for nested_folders, items in results:
+        sub_folders += nested_folders
+        sub_items += items
+    return sub_folders, sub_items
+
+
+def _scan_folder(path: str) -> tuple[list[str], list[os.DirEntry]]:
+    """Reads `path` once, splitting its entries into sub-folder paths and other entries."""
+    sub_folders = []
+    items = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                sub_folders.append(entry.path)
+            else:
+                items.append(entry)
+    return sub_folders, items
+
+
+def _move(src: str, dst: str) -> None:
+    """Renames `src` to `dst`, copying instead only when they are on different file systems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
 def get_most_recent_recording(path: str) -> str | None:
     """
     Retrieves the most recent recording file in the specified path.
@@ -56,12 +109,13 @@ def get_most_recent_recording(path: str) -> str | None:
         str or None: The path to the most recent recording file, or None if no recording files are found.
 
     Note:
-        - This function searches for recording files (files with the '.mp4' extension) within the specified path.
+        - This function searches for recording files (files with the '.mp4' or '.MP4' extension) within the specified path.
         - If no recording files are found, the function returns None.
         - The most recent recording file is determined based on its modification timestamp.
         - If multiple recording files have the same modification timestamp, the function returns the first
         encountered in the list.
-        - The function assumes that the 'os' module is imported.
+        - The directory is read with `os.scandir` and reduced in a single pass, so no list of candidates is built
+          and the returned path needs no extra join.
 
     Example:
         # Provide the path of the folder containing the recordings
@@ -73,17 +127,19 @@ def get_most_recent_recording(path: str) -> str | None:
         else:
             print("No recordings found in the folder.")
     """
-    files = os.listdir(path)
-    files = [f for f in files if f.endswith(".mp4")]
-
-    if not files:
+    with os.scandir(path) as it:
+        most_recent_entry = max(
+            (entry for entry in it if entry.name.endswith(RECORDING_SUFFIXES)),
+            key=lambda entry: entry.stat().st_mtime,
+            default=None,
+        )
+
+    if most_recent_entry is None:
         return
-
-    most_recent_file = max(files, key=lambda f: os.path.getmtime(os.path.join(path, f)))
-    return os.path.join(path, most_recent_file)
+    return most_recent_entry.path
 
 
-def get_all_recordings_for_today(path: str) -> List[str] | None:
+def get_all_recordings_for_today(path: str) -> List[str]:
     """
     Retrieves the all mp4 files in the specified path that occurred today.
 
@@ -91,14 +147,15 @@ def get_all_recordings_for_today(path: str) -> List[str] | None:
         path (str): The path of the folder containing the recording files.
 
     Returns:
-        list[str] or []: The path to the most recent recording file, or None if no recording files are found.
+        list[str]: The paths to the recording files modified today, or an empty list if none are found.
 
     Note:
-        - This function searches for recording files (files with the '.mp4' extension) within the specified path.
+        - This function searches for recording files (files with the '.mp4' or '.MP4' extension) within the specified path.
         - If no recording files are found, the function returns an empty list.
-        - Recording files are determined based on their modification timestamp.
+        - Recording files are determined based on their modification timestamp, compared against the timestamp
+          range of the current date computed once per call.
         - If multiple recording files have the same modification timestamp, the function returns all.
-        - The function assumes that the 'os' module is imported.
+        - The directory is read with `os.scandir`, so each entry's path and modification time come from one pass.
 
     Example:
         # Provide the path of the folder containing the recordings
@@ -111,44 +168,19 @@ def get_all_recordings_for_today(path: str) -> List[str] | None:
         else:
             print("No recordings found in the folder for today.")
     """
-    files = os.listdir(path)
-    files = [
-        os.path.join(path, f)
-        for f in files
-        if f.endswith(".mp4") and file_was_created_today(os.path.join(path, f))
-    ]
+    start_ts, end_ts = _today_range()
+    with os.scandir(path) as it:
+        files = [
+            entry.path
+            for entry in it
+            if entry.name.endswith(RECORDING_SUFFIXES) and start_ts <= entry.stat().st_mtime < end_ts
+        ]
     return files
 
 
-def file_was_created_today(mp4: str) -> bool | None:
-    """
-    Checks if the specified MP4 file was created today.
-
-    Parameters:
-        mp4 (str): The path of the MP4 file to check.
-
-    Returns:
-        bool: True if the file was created today, None otherwise.
-
-    Example:
-        # Check if the file "video.mp4" was created today
-        is_today = file_was_created_today("path/to/video.mp4")
-
-    Raises:
-        FileNotFoundError: If the specified file does not exist.
-
-    Note:
-        - This function determines if the MP4 file was created on the same day as the current date.
-        - The function uses the modification timestamp of the file to make the determination.
-        - The file path should be provided as a string.
-    """
-    try:
-        mp4_time_stamp = os.path.getmtime(os.path.join(mp4))
-        current_date = date.today()
-        timestamp_datetime = datetime.utcfromtimestamp(mp4_time_stamp)
-        timestamp_date = timestamp_datetime.date()
-        if timestamp_date == current_date:
-            return True
-    except FileNotFoundError:
-        print(f"File: {mp4} was not found.")
-        raise
+def _today_range() -> tuple[float, float]:
+    """Returns the half-open [start, end) timestamp range of the current local date."""
+    today = date.today()
+    start_ts = datetime.combine(today, time.min).timestamp()
+    end_ts = datetime.combine(today + timedelta(days=1), time.min).timestamp()
+    return start_ts, end_ts
@@ -1,8 +1,16 @@
+import hashlib
+import logging
+import math
+import multiprocessing
 import os
+import subprocess
 
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import dotenv_values
-from moviepy.video.io.VideoFileClip import VideoFileClip
+from functools import lru_cache
+from itertools import repeat
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.sharedctypes import Synchronized
 from typing import Optional
 
 from folder_logic import (
@@ -11,14 +19,20 @@ from folder_logic import (
     get_all_recordings_for_today,
 )
 
+log = logging.getLogger(__name__)
 
-env_vars = dotenv_values(".env")
+FFMPEG_BIN: str = "ffmpeg"
+MP3_ENCODER: str = "libmp3lame"
+MP3_BITRATE: str = "192k"
+# LAME's algorithm quality, from 0 (slowest, best) to 9 (fastest); None keeps the encoder's default.
+MP3_COMPRESSION_LEVEL: str | None = None
+BATCH_SIZE: int = 32
+WORKER_NICENESS: int = -5
 
-FOLDER_PATH: str | None = env_vars["FOLDER_PATH"]
-DESTINATION_PATH: str | None = env_vars["DESTINATION_PATH"]
 
-
-def convert_mp4_to_mp3(file_path: str, destination_path: Optional[str] = None) -> None:
+def convert_mp4_to_mp3(
+    file_path: str, destination_path: Optional[str] = None, stem: Optional[str] = None
+) -> None:
     """
     Converts an MP4 file to MP3 format.
 
@@ -26,6 +40,8 @@ def convert_mp4_to_mp3(file_path: str, destination_path: Optional[str] = None) -
         file_path (str): The path of the input MP4 file.
         destination_path (str, optional): The path where the converted MP3 file should be saved.
             If not provided, the MP3 file will be saved in the same directory as the input file with a new filename.
+        stem (str, optional): The output file name without the '.mp3' extension.
+            If not provided, it is derived from the input file path.
 
     Returns:
         None
@@ -35,35 +51,319 @@ def convert_mp4_to_mp3(file_path: str, destination_path: Optional[str] = None) -
         convert_mp4_to_mp3("path/to/video.mp4")
 
     Note:
-        - This function uses the `VideoFileClip` class from the moviepy library to extract the audio from the MP4 file.
+        - This function runs `ffmpeg` as a subprocess to extract the audio from the MP4 file. The video stream is
+          dropped with `-vn`, so it is never decoded.
         - If the `destination_path` parameter is not provided, the MP3 file will be saved in the same directory as the input file.
-        - The output file name will be generated based on the current date and time in the format: "YYYY-MM-DD_HH_MM_SS.mp3".
+        - Unless a `stem` is given, the output file name is the input file name followed by a short hash of the
+          input path, in the format: "<name>-<hash>.mp3". Converting the same recording again overwrites the
+          previous MP3.
         - The output file path will be created by replacing the file name in the `destination_path` with the generated output file name.
         - The input MP4 file should have compatible audio codecs that can be extracted and saved as an MP3 file.
 
     Raises:
-        OSError: If an error occurs during the conversion process, such as a file not found error or unsupported codec.
+        OSError: If the `ffmpeg` executable cannot be found or started.
+        subprocess.CalledProcessError: If `ffmpeg` exits with an error, such as a missing file or unsupported codec.
 
     """
     if destination_path is None:
         destination_path = file_path
 
-    video: VideoFileClip = VideoFileClip(file_path)
+    if stem is None:
+        stem = _output_stem(file_path)
 
-    current_datetime = datetime.now().strftime("%Y-%m-%d_%H_%M_%S-%MS")
+    output_file_path = _output_file_path(destination_path, stem)
 
-    output_file_name = current_datetime + ".mp3"
-    output_file_path = os.path.join(
-        os.path.dirname(destination_path), output_file_name
-    ).replace("\\", "/")
+    cmd = [FFMPEG_BIN, "-y", "-i", file_path, "-vn", *_mp3_output_args(output_file_path)]
 
     try:
-        video.audio.write_audiofile(output_file_path, codec="mp3")  # type: ignore
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.error(f"An error occurred during MP4 to MP3 conversion: {e}")
+        raise
+
+
+def convert_mp4_to_mp3_stream(file_path: str) -> "Mp3Stream":
+    """
+    Converts an MP4 file to MP3 format and streams the result instead of writing it to disk.
+
+    Parameters:
+        file_path (str): The path of the input MP4 file.
+
+    Returns:
+        Mp3Stream: A file-like reader over the running `ffmpeg` process, yielding the encoded MP3 data.
+
+    Example:
+        # Stream the audio of "video.mp4" into another file-like object
+        with convert_mp4_to_mp3_stream("path/to/video.mp4") as mp3:
+            shutil.copyfileobj(mp3, destination)
+
+    Note:
+        - This function uses the same `ffmpeg` options as `convert_mp4_to_mp3`, but writes the MP3 data to
+          `pipe:1` so that a downstream consumer can read it without an intermediate file.
+        - The `ffmpeg` process keeps running while the stream is read. Read the stream to the end and close it
+          (or use it as a context manager), otherwise the process may block on a full pipe.
+        - A failed conversion is only reported when the stream is closed after being read to the end, since
+          `ffmpeg` may already have produced some output before it fails. Closing the stream early stops `ffmpeg`
+          without raising.
+
+    Raises:
+        OSError: If the `ffmpeg` executable cannot be found or started.
+        subprocess.CalledProcessError: Raised by `Mp3Stream.close` if the stream was read to the end and `ffmpeg`
+            exited with an error, such as a missing file or no audio stream.
+
+    """
+    cmd = [FFMPEG_BIN, "-i", file_path, "-vn", "-f", "mp3", *_mp3_output_args("pipe:1")]
+
+    try:
+        process = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE
+        )
     except OSError as e:
-        print(f"An error occurred during MP4 to MP3 conversion: {e}")
+        log.error(f"An error occurred during MP4 to MP3 conversion: {e}")
         raise
+    return Mp3Stream(process)
+
+
+class Mp3Stream:
+    """
+    Reads the MP3 data written by a running `ffmpeg` process.
+
+    Closing the stream after reading it to the end waits for `ffmpeg` to exit and raises
+    `subprocess.CalledProcessError` if it failed, so an unsuccessful conversion is never mistaken for empty audio.
+    Closing it before the end, or leaving a `with` block because of an exception, stops `ffmpeg` with `terminate`
+    instead and does not check its exit status, since the conversion was abandoned rather than failed.
+    """
+
+    def __init__(self, process: "subprocess.Popen[bytes]") -> None:
+        self.process = process
+        self.at_end = False
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to `size` bytes of MP3 data, or everything that is left if `size` is negative."""
+        data = self.process.stdout.read(size)  # type: ignore
+        if size != 0 and (size < 0 or not data):
+            self.at_end = True
+        return data
+
+    def close(self) -> None:
+        """
+        Closes the pipe and reaps `ffmpeg`.
+
+        Raises `subprocess.CalledProcessError` if the stream was read to the end and `ffmpeg` exited with an error.
+        """
+        if self.process.returncode is not None:
+            return
+        if not self.at_end:
+            self.terminate()
+            return
+        self.process.stdout.close()  # type: ignore
+        returncode = self.process.wait()
+        if returncode != 0:
+            e = subprocess.CalledProcessError(returncode, self.process.args)
+            log.error(f"An error occurred during MP4 to MP3 conversion: {e}")
+            raise e
+
+    def terminate(self) -> None:
+        """Stops `ffmpeg` without checking its exit status, for streams that are abandoned before the end."""
+        if self.process.returncode is not None:
+            return
+        self.process.stdout.close()  # type: ignore
+        self.process.terminate()
+        self.process.wait()
+
+    def __enter__(self) -> "Mp3Stream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+def convert_mp4s_to_mp3s(
+    file_paths: list[str], destination_path: Optional[str] = None
+) -> None:
+    """
+    Converts several MP4 files to MP3 format, running batches of files in parallel worker processes.
+
+    Parameters:
+        file_paths (list[str]): The paths of the input MP4 files.
+        destination_path (str, optional): The path where the converted MP3 files should be saved.
+            If not provided, each MP3 file will be saved in the same directory as its input file.
+
+    Returns:
+        None
+
+    Example:
+        # Convert two recordings to MP3 format
+        convert_mp4s_to_mp3s(["path/to/a.mp4", "path/to/b.mp4"], "path/to/sounds/")
+
+    Note:
+        - The files are split into one batch per usable CPU core, each holding at most `BATCH_SIZE` files, and the
+          batches are converted concurrently in a `ProcessPoolExecutor` with no more workers than batches.
+        - Each batch is passed to one `ffmpeg` invocation with one `-i` per input and one `-map` per output, so
+          process startup is paid once per batch instead of once per file.
+        - Output file names follow the same "<name>-<hash>.mp3" format as `convert_mp4_to_mp3` and are computed
+          once upfront, so parallel workers never write to the same file.
+        - If `ffmpeg` fails on a batch, for example because one recording has no audio track, the files in that
+          batch are converted one at a time instead. The good files are still converted, each bad file is named
+          in the log, and the first failure is re-raised once the pool shuts down.
+        - Each worker is pinned to its own CPU core where the OS supports it, and every output is encoded with
+          `-threads 1`, so parallel encoders do not oversubscribe cores or bounce between their caches.
+        - Every `ffmpeg` process gets its stdin from `os.devnull`, so concurrent encoders never read keypresses
+          from, or change the mode of, the user's terminal.
+        - Workers send their log records through a queue to a `QueueListener` thread in the parent process, which
+          writes them with the parent's logging handlers.
+
+    Raises:
+        OSError: If the `ffmpeg` executable cannot be found or started.
+        subprocess.CalledProcessError: If `ffmpeg` exits with an error, such as a missing file or unsupported codec.
+
+    """
+    if not file_paths:
+        return
+    stems = [_output_stem(file_path) for file_path in file_paths]
+
+    cpus = _usable_cpus()
+    workers = len(cpus) if cpus else os.cpu_count() or 1
+    batch_size = min(BATCH_SIZE, math.ceil(len(file_paths) / workers))
+    starts = range(0, len(file_paths), batch_size)
+    path_batches = [file_paths[start : start + batch_size] for start in starts]
+    stem_batches = [stems[start : start + batch_size] for start in starts]
+
+    log_queue: "multiprocessing.Queue[logging.LogRecord]" = multiprocessing.Queue()
+    worker_counter = multiprocessing.Value("i", 0)
+    handlers = logging.getLogger().handlers or [logging.StreamHandler()]
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(path_batches)),
+            initializer=_init_worker,
+            initargs=(
+                log_queue, logging.getLogger().getEffectiveLevel(), worker_counter, cpus
+            ),
+        ) as executor:
+            list(
+                executor.map(
+                    _convert_batch, path_batches, stem_batches, repeat(destination_path)
+                )
+            )
     finally:
-        video.close()  # type: ignore
+        listener.stop()
+
+
+def _usable_cpus() -> list[int]:
+    """Returns the CPU cores this process may run on, or an empty list where the OS cannot report them."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return []
+
+
+def _init_worker(
+    log_queue: "multiprocessing.Queue[logging.LogRecord]",
+    log_level: int,
+    worker_counter: Synchronized,
+    cpus: list[int],
+) -> None:
+    """
+    Prepares a pool worker before it converts any batch.
+
+    Routes the worker's log records at `log_level` and above through `log_queue` to the parent's handlers,
+    pins the worker (and the `ffmpeg` processes it starts) to its own core from `cpus`, and raises its priority
+    when the OS permits it. The pool is sized from the same `cpus`, so no two workers share a core.
+    """
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(log_level)
+
+    with worker_counter.get_lock():
+        worker_id = worker_counter.value
+        worker_counter.value += 1
+
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
+
+    if hasattr(os, "nice"):
+        try:
+            os.nice(WORKER_NICENESS)
+        except OSError:
+            pass
+
+
+def _convert_batch(
+    file_paths: list[str], stems: list[str], destination_path: Optional[str]
+) -> None:
+    """Converts `file_paths` to MP3 with a single ffmpeg process, writing one `stems` output per input."""
+    cmd = [FFMPEG_BIN, "-y"]
+    for file_path in file_paths:
+        cmd += ["-i", file_path]
+    for index, (file_path, stem) in enumerate(zip(file_paths, stems, strict=True)):
+        output_file_path = _output_file_path(destination_path or file_path, stem)
+        cmd += ["-map", f"{index}:a:0", *_mp3_output_args(output_file_path)]
+
+    try:
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
+    except OSError as e:
+        log.error(f"An error occurred during MP4 to MP3 conversion: {e}")
+        raise
+    except subprocess.CalledProcessError as e:
+        if len(file_paths) == 1:
+            log.error(f"An error occurred during MP4 to MP3 conversion: {e}")
+            raise
+        log.warning(
+            f"Batch conversion of {len(file_paths)} files failed, converting them one at a time."
+        )
+        _convert_one_by_one(file_paths, stems, destination_path)
+
+
+def _convert_one_by_one(
+    file_paths: list[str], stems: list[str], destination_path: Optional[str]
+) -> None:
+    """Converts each file separately, so one bad input doesn't stop the rest; re-raises the first failure."""
+    first_error: subprocess.CalledProcessError | None = None
+    for file_path, stem in zip(file_paths, stems, strict=True):
+        try:
+            convert_mp4_to_mp3(file_path, destination_path, stem)
+        except subprocess.CalledProcessError as e:
+            log.error(f"Could not convert '{file_path}'.")
+            first_error = first_error or e
+    if first_error is not None:
+        raise first_error
+
+
+def _output_stem(file_path: str) -> str:
+    """Returns the input file name followed by a short, stable hash of its absolute path."""
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()[:8]
+    return f"{name}-{digest}"
+
+
+def _output_file_path(destination_path: str, stem: str) -> str:
+    """Builds the MP3 path for `stem` inside the directory of `destination_path`."""
+    return os.path.join(os.path.dirname(destination_path), stem + ".mp3").replace(
+        "\\", "/"
+    )
+
+
+def _mp3_output_args(output_file_path: str) -> list[str]:
+    """Returns the ffmpeg encoder options for one MP3 output, ending with the output path."""
+    args = ["-threads", "1", "-acodec", MP3_ENCODER, "-b:a", MP3_BITRATE]
+    if MP3_COMPRESSION_LEVEL is not None:
+        args += ["-compression_level", MP3_COMPRESSION_LEVEL]
+    return [*args, output_file_path]
+
+
+@lru_cache(maxsize=1)
+def _env() -> dict[str, str | None]:
+    """Parses the '.env' file once, deferred until a conversion actually needs the configured paths."""
+    return dotenv_values(".env")
+
+
+def _env_path(key: str) -> str | None:
+    """Returns the path configured for `key` in the '.env' file, or None if it is missing or empty."""
+    return _env().get(key) or None
 
 
 def convert_most_recent_mp4() -> None:
@@ -84,11 +384,12 @@ def convert_most_recent_mp4() -> None:
         - The retrieved MP4 file path is then passed to the `convert_mp4_to_mp3` function for conversion.
 
     """
-    if FOLDER_PATH:
-        mp4 = get_most_recent_recording(FOLDER_PATH)
+    folder_path = _env_path("FOLDER_PATH")
+    if folder_path:
+        mp4 = get_most_recent_recording(folder_path)
         if mp4 is None:
             return
-        convert_mp4_to_mp3(mp4, DESTINATION_PATH)
+        convert_mp4_to_mp3(mp4, _env_path("DESTINATION_PATH"))
 
 
 def convert_all_mp4s_for_today() -> None:
@@ -105,19 +406,19 @@ def convert_all_mp4s_for_today() -> None:
     Note:
         - This function retrieves a list of MP4 recordings for the current day using the `get_all_recordings_for_today`
           function from the "folder_logic" module.
-        - The function then iterates over each MP4 file in the list and passes it to the `convert_mp4_to_mp3` function
-          for conversion.
+        - The list of MP4 files is then passed to the `convert_mp4s_to_mp3s` function, which converts them in
+          parallel batches.
         - If there are no MP4 recordings found for the current day, the function will not perform any conversion.
 
     """
-    list_of_mp4s: list[str] | None = get_all_recordings_for_today(FOLDER_PATH)  # type: ignore
-    if list_of_mp4s is None:
-        print(
-            "No MP4 recording found in the recordings folder. Ensure the '.env' folder has the proper paths set."
-        )
+    folder_path = _env_path("FOLDER_PATH")
+    if not folder_path:
+        return
+    list_of_mp4s: list[str] = get_all_recordings_for_today(folder_path)
+    if not list_of_mp4s:
+        print("No MP4 recordings found for today.")
         return
-    for mp4 in list_of_mp4s:
-        convert_mp4_to_mp3(mp4, DESTINATION_PATH)
+    convert_mp4s_to_mp3s(list_of_mp4s, _env_path("DESTINATION_PATH"))
 
 
 def main():
@@ -135,7 +436,7 @@ def main():
             main()
 
     Note:
-        - This function serves as the entry point for the program.
+        - This function serves as the entry point for the program and configures logging for it.
         - The user is prompted to select an option by entering '1' for the most recent recording
           or '2' for all recordings today.
         - If an invalid selection is made, the program will display an error message and prompt again.
@@ -144,6 +445,8 @@ def main():
           or `convert_all_mp4s_for_today`) is called from the `menu_logic` dictionary.
 
     """
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+
     while (
         user_input := input(
             "Press '1' for the most recent recording.\n"
@@ -153,10 +456,13 @@ def main():
     ) not in {"1", "2"}:
         print("Invalid selection.")
 
-    if FOLDER_PATH is None:
-        print("Folder path is not specified. Please check your '.env' file.")
+    folder_path = _env_path("FOLDER_PATH")
+    if not folder_path:
+        print(
+            "Folder path is not specified. Set FOLDER_PATH in your '.env' file, see '.env.example'."
+        )
         return
-    collapse_sub_folders(FOLDER_PATH)
+    collapse_sub_folders(folder_path)
     menu_logic = {"1": convert_most_recent_mp4, "2": convert_all_mp4s_for_today}
     menu_logic[user_input]()
 